@@ -4,9 +4,20 @@ import sys
 import time
 import json
 import math
-from copy import deepcopy
+import re
+import pickle
+import hashlib
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from operator import itemgetter
 import requests
 from PIL import Image
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from scan_electrums import get_electrums_report
 from ensure_chainids import ensure_chainids
 from logger import logger
@@ -16,6 +27,7 @@ current_time = time.time()
 script_path = os.path.abspath(os.path.dirname(__file__))
 repo_path = script_path.replace("/utils", "")
 os.chdir(script_path)
+coins_config_cache_path = f"{script_path}/.coins_config.cache"
 
 BINANCE_DELISTED_COINS = [
     "AGIX",
@@ -53,37 +65,50 @@ MISMATCHED_IDS = [
     "SC",
 ]
 
+
+def list_files(path):
+    with os.scandir(path) as entries:
+        return {e.name for e in entries if e.is_file()}
+
+
+def read_json(path):
+    """Parse a JSON file, via orjson when it is installed."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def load_json(path):
+    """Parsed sidecar files are shared between coins, treat them as read only."""
+    return read_json(path)
+
+
+def write_json(path, data):
+    """Write JSON output, via orjson when it is installed."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True, ensure_ascii=False)
+
+
+@lru_cache(maxsize=None)
+def load_rpc_nodes(path):
+    """Sort a sidecar file's rpc_nodes once, for every coin that uses it."""
+    return sort_dicts_list(load_json(path)["rpc_nodes"], "url")
+
+
 # TODO: Check all coins have an icon.
-icons = [
-    f
-    for f in os.listdir(f"{repo_path}/icons")
-    if os.path.isfile(f"{repo_path}/icons/{f}.png")
-]
-lightwallet_coins = [
-    f
-    for f in os.listdir(f"{repo_path}/light_wallet_d")
-    if os.path.isfile(f"{repo_path}/light_wallet_d/{f}")
-]
-electrum_coins = [
-    f
-    for f in os.listdir(f"{repo_path}/electrums")
-    if os.path.isfile(f"{repo_path}/electrums/{f}")
-]
-tendermint_coins = [
-    f
-    for f in os.listdir(f"{repo_path}/tendermint")
-    if os.path.isfile(f"{repo_path}/tendermint/{f}")
-]
-ethereum_coins = [
-    f
-    for f in os.listdir(f"{repo_path}/ethereum")
-    if os.path.isfile(f"{repo_path}/ethereum/{f}")
-]
-explorer_coins = [
-    f
-    for f in os.listdir(f"{repo_path}/explorers")
-    if os.path.isfile(f"{repo_path}/explorers/{f}")
-]
+icons = list_files(f"{repo_path}/icons")
+lightwallet_coins = list_files(f"{repo_path}/light_wallet_d")
+electrum_coins = list_files(f"{repo_path}/electrums")
+tendermint_coins = list_files(f"{repo_path}/tendermint")
+ethereum_coins = list_files(f"{repo_path}/ethereum")
+explorer_coins = list_files(f"{repo_path}/explorers")
 
 binance_quote_tickers = [
     "BTC",
@@ -104,23 +129,61 @@ binance_quote_tickers = [
     "UAH",
 ]
 
-with open(f"{repo_path}/explorers/explorer_paths.json", "r") as f:
-    explorer_paths = json.load(f)
-
-with open(f"{repo_path}/api_ids/forex_ids.json", "r") as f:
-    forex_ids = json.load(f)
-
-with open(f"{repo_path}/api_ids/livecoinwatch_ids.json", "r") as f:
-    livecoinwatch_ids = json.load(f)
-
-with open(f"{repo_path}/api_ids/binance_ids.json", "r") as f:
-    binance_ids = json.load(f)
-
-with open(f"{repo_path}/api_ids/coingecko_ids.json", "r") as f:
-    coingecko_ids = json.load(f)
-
-with open(f"{repo_path}/api_ids/coinpaprika_ids.json", "r") as f:
-    coinpaprika_ids = json.load(f)
+# Matches a binance symbol which starts or ends with a quote ticker, trying
+# the quotes in the order above. Quote i is captured by group 2i+1 when it is
+# the prefix and by group 2i+2 when it is the suffix.
+BINANCE_SYMBOL_RE = re.compile(
+    "|".join(f"({quote}).*|.*({quote})" for quote in binance_quote_tickers)
+)
+
+PROTOCOLS = {
+    "AVAX": "AVX-20",
+    "BNB": "BEP-20",
+    "ETC": "Ethereum Classic",
+    "ETH": "ERC-20",
+    "ETH-ARB20": "Arbitrum",
+    "EWT": "EWT",
+    "FTM": "FTM-20",
+    "GLMR": "Moonbeam",
+    "HT": "HecoChain",
+    "KCS": "KRC-20",
+    "MATIC": "Matic",
+    "MOVR": "Moonriver",
+    "ONE": "HRC-20",
+    "QTUM": "QRC-20",
+    "RBTC": "RSK Smart Bitcoin",
+    "SBCH": "SmartBCH",
+    "ATOM": "TENDERMINT",
+    "OSMO": "TENDERMINT",
+    "IRIS": "TENDERMINT",
+    "UBQ": "Ubiq",
+}
+
+TESTNET_PROTOCOLS = {
+    "AVAXT": "AVX-20",
+    "BNBT": "BEP-20",
+    "FTMT": "FTM-20",
+    "tQTUM": "QRC-20",
+    "IRISTEST": "TENDERMINT",
+    "NUCLEUSTEST": "TENDERMINT",
+    "MATICTEST": "Matic",
+    "UBQ": "Ubiq",
+}
+
+TENDERMINT_TESTNET_PARENTS = ("IRISTEST", "NUCLEUSTEST")
+TENDERMINT_IBC_PARENTS = ("IBC_IRIS", "IBC_ATOM", "IBC_OSMO")
+
+# Reverse lookups of parent coin by token type. Where several parents share
+# a type (e.g. TENDERMINT), the first one listed wins.
+PROTOCOL_PARENTS = {v: k for k, v in reversed(PROTOCOLS.items())}
+TESTNET_PROTOCOL_PARENTS = {v: k for k, v in reversed(TESTNET_PROTOCOLS.items())}
+
+explorer_paths = read_json(f"{repo_path}/explorers/explorer_paths.json")
+forex_ids = read_json(f"{repo_path}/api_ids/forex_ids.json")
+livecoinwatch_ids = read_json(f"{repo_path}/api_ids/livecoinwatch_ids.json")
+binance_ids = read_json(f"{repo_path}/api_ids/binance_ids.json")
+coingecko_ids = read_json(f"{repo_path}/api_ids/coingecko_ids.json")
+coinpaprika_ids = read_json(f"{repo_path}/api_ids/coinpaprika_ids.json")
 
 
 
@@ -132,144 +195,89 @@ class CoinConfig:
         self.data = {}
         self.is_testnet = self.is_testnet_network()
         self.ticker = self.coin_data["coin"].replace("-TEST", "")
-        self.base_ticker = self.ticker.split("-")[0]
-        self.protocols = {
-            "AVAX": "AVX-20",
-            "BNB": "BEP-20",
-            "ETC": "Ethereum Classic",
-            "ETH": "ERC-20",
-            "ETH-ARB20": "Arbitrum",
-            "EWT": "EWT",
-            "FTM": "FTM-20",
-            "GLMR": "Moonbeam",
-            "HT": "HecoChain",
-            "KCS": "KRC-20",
-            "MATIC": "Matic",
-            "MOVR": "Moonriver",
-            "ONE": "HRC-20",
-            "QTUM": "QRC-20",
-            "RBTC": "RSK Smart Bitcoin",
-            "SBCH": "SmartBCH",
-            "ATOM": "TENDERMINT",
-            "OSMO": "TENDERMINT",
-            "IRIS": "TENDERMINT",
-            "UBQ": "Ubiq",
-        }
-        self.testnet_protocols = {
-            "AVAXT": "AVX-20",
-            "BNBT": "BEP-20",
-            "FTMT": "FTM-20",
-            "tQTUM": "QRC-20",
-            "IRISTEST": "TENDERMINT",
-            "NUCLEUSTEST": "TENDERMINT",
-            "MATICTEST": "Matic",
-            "UBQ": "Ubiq",
-        }
+        self.base_ticker = self.ticker.split("-", 1)[0]
+        self.no_segwit_ticker = self.ticker.replace("-segwit", "")
         self.coin_type = coin_data["protocol"]["type"]
-        self.data.update(
-            {
-                self.ticker: {
-                    "coin": self.ticker,
-                    "type": "",
-                    "name": "",
-                    "coinpaprika_id": "",
-                    "coingecko_id": "",
-                    "livecoinwatch_id": "",
-                    "explorer_url": "",
-                    "explorer_tx_url": "",
-                    "explorer_address_url": "",
-                    "supported": [],
-                    "active": False,
-                    "is_testnet": self.is_testnet,
-                    "currently_enabled": False,
-                    "wallet_only": False,
-                }
-            }
-        )
+        d = self.data[self.ticker] = {
+            "coin": self.ticker,
+            "type": "",
+            "name": "",
+            "coinpaprika_id": "",
+            "coingecko_id": "",
+            "livecoinwatch_id": "",
+            "explorer_url": "",
+            "explorer_tx_url": "",
+            "explorer_address_url": "",
+            "supported": [],
+            "active": False,
+            "is_testnet": self.is_testnet,
+            "currently_enabled": False,
+            "wallet_only": False,
+        }
         if self.coin_type in ["UTXO", "QRC20", "QTUM", "SIA"]:
             try:
                 if self.coin_data["sign_message_prefix"]:
-                    self.data[self.ticker].update(
-                        {"sign_message_prefix": coin_data["sign_message_prefix"]}
-                    )
+                    d["sign_message_prefix"] = coin_data["sign_message_prefix"]
                 else:
-                    self.data[self.ticker].update({"sign_message_prefix": ""})
+                    d["sign_message_prefix"] = ""
             except KeyError as e:
                 print(self.ticker + ": Sign message was not found\n")
         elif self.coin_type in ["ZHTLC"]:
             if self.ticker in lightwallet_coins:
-                with open(f"{repo_path}/light_wallet_d/{self.ticker}", "r") as f:
-                    lightwallet_servers = json.load(f)
-                self.data[self.ticker].update(
-                    {"light_wallet_d_servers": lightwallet_servers}
-                )
+                d["light_wallet_d_servers"] = load_json(f"{repo_path}/light_wallet_d/{self.ticker}")
             else:
-                self.data[self.ticker].update({"light_wallet_d_servers": []})
+                d["light_wallet_d_servers"] = []
         elif self.coin_type in ["SIA"]:
-            self.data[self.ticker].update({"nodes": ["SIA"]})
+            d["nodes"] = ["SIA"]
 
     def get_protocol_info(self):
+        d = self.data[self.ticker]
         if "protocol_data" in self.coin_data["protocol"]:
             protocol_data = self.coin_data["protocol"]["protocol_data"]
             if "consensus_params" in protocol_data:
                 # TODO: ZHTLC things
-                self.data[self.ticker].update({"type": self.coin_type})
+                d["type"] = self.coin_type
             if "check_point_block" in protocol_data:
                 # ZHTLC only
                 if "height" in protocol_data["check_point_block"]:
-                    self.data[self.ticker].update(
-                        {
-                            "checkpoint_height": protocol_data["check_point_block"][
-                                "height"
-                            ]
-                        }
-                    )
+                    d["checkpoint_height"] = protocol_data["check_point_block"]["height"]
                 if "time" in protocol_data["check_point_block"]:
-                    self.data[self.ticker].update(
-                        {
-                            "checkpoint_blocktime": protocol_data["check_point_block"][
-                                "time"
-                            ]
-                        }
-                    )
+                    d["checkpoint_blocktime"] = protocol_data["check_point_block"]["time"]
 
 
             elif "platform" in protocol_data:
                 # TODO: ERC-like things
                 platform = protocol_data["platform"]
                 if self.is_testnet:
-                    coin_type = self.testnet_protocols[platform]
+                    coin_type = TESTNET_PROTOCOLS[platform]
                 else:
-                    coin_type = self.protocols[platform]
-                self.data[self.ticker].update({"type": coin_type})
+                    coin_type = PROTOCOLS[platform]
+                d["type"] = coin_type
                 if "contract_address" in protocol_data:
-                    self.data[self.ticker].update(
-                        {"contract_address": protocol_data["contract_address"]}
-                    )
+                    d["contract_address"] = protocol_data["contract_address"]
         else:
-            self.data[self.ticker].update({"type": self.coin_type})
+            d["type"] = self.coin_type
 
         self.parent_coin = self.get_parent_coin()
         if self.parent_coin:
             if self.parent_coin != self.ticker:
-                self.data[self.ticker].update({"parent_coin": self.parent_coin})
+                d["parent_coin"] = self.parent_coin
 
         if self.coin_data["protocol"]["type"] in ["ETH", "QTUM"]:
-            if self.ticker in self.protocols:
-                coin_type = self.protocols[self.ticker]
-            elif self.ticker in self.testnet_protocols:
-                coin_type = self.testnet_protocols[self.ticker]
-            elif self.parent_coin in self.protocols:
-                coin_type = self.protocols[self.parent_coin]
-            elif self.parent_coin in self.testnet_protocols:
-                coin_type = self.testnet_protocols[self.parent_coin]
+            if self.ticker in PROTOCOLS:
+                coin_type = PROTOCOLS[self.ticker]
+            elif self.ticker in TESTNET_PROTOCOLS:
+                coin_type = TESTNET_PROTOCOLS[self.ticker]
+            elif self.parent_coin in PROTOCOLS:
+                coin_type = PROTOCOLS[self.parent_coin]
+            elif self.parent_coin in TESTNET_PROTOCOLS:
+                coin_type = TESTNET_PROTOCOLS[self.parent_coin]
             else:
                 coin_type = self.coin_data["protocol"]["type"]
-            self.data[self.ticker].update({"type": coin_type})
+            d["type"] = coin_type
 
         elif self.coin_data["protocol"]["type"] in ["TENDERMINT", "TENDERMINTTOKEN"]:
-            coin_type = self.coin_data["protocol"]["type"]
-            self.data[self.ticker].update({"type": coin_type})
+            d["type"] = self.coin_data["protocol"]["type"]
 
     def is_testnet_network(self):
         if "is_testnet" in self.coin_data:
@@ -277,53 +285,43 @@ class CoinConfig:
         return False
 
     def get_forex_id(self):
-        coin = self.ticker.replace("-segwit", "")
-        if coin in forex_ids:
-            self.data[self.ticker].update({"forex_id": forex_ids[coin]})
+        if (value := forex_ids.get(self.no_segwit_ticker)) is not None:
+            self.data[self.ticker]["forex_id"] = value
 
     def get_coinpaprika_id(self):
-        coin = self.ticker.replace("-segwit", "")
-        if coin in coinpaprika_ids:
-            self.data[self.ticker].update({"coinpaprika_id": coinpaprika_ids[coin]})
+        if (value := coinpaprika_ids.get(self.no_segwit_ticker)) is not None:
+            self.data[self.ticker]["coinpaprika_id"] = value
 
     def get_coingecko_id(self):
-        coin = self.ticker.replace("-segwit", "")
-        if coin in coingecko_ids:
-            self.data[self.ticker].update({"coingecko_id": coingecko_ids[coin]})
+        if (value := coingecko_ids.get(self.no_segwit_ticker)) is not None:
+            self.data[self.ticker]["coingecko_id"] = value
 
     def get_livecoinwatch_id(self):
-        coin = self.ticker.split("-")[0]
-        if coin in livecoinwatch_ids:
-            self.data[self.ticker].update({"livecoinwatch_id": livecoinwatch_ids[coin]})
+        if (value := livecoinwatch_ids.get(self.base_ticker)) is not None:
+            self.data[self.ticker]["livecoinwatch_id"] = value
 
     def get_binance_id(self):
-        coin = self.ticker.split("-")[0]
-        if coin in binance_ids:
-            self.data[self.ticker].update({"binance_id": binance_ids[coin]})
+        if (value := binance_ids.get(self.base_ticker)) is not None:
+            self.data[self.ticker]["binance_id"] = value
 
     def get_alias_ticker(self):
         if "alias_ticker" in self.coin_data:
-            self.data[self.ticker].update(
-                {"alias_ticker": self.coin_data["alias_ticker"]}
-            )
+            self.data[self.ticker]["alias_ticker"] = self.coin_data["alias_ticker"]
 
     def get_asset(self):
         if "asset" in self.coin_data:
-            self.data[self.ticker].update({"asset": self.coin_data["asset"]})
+            self.data[self.ticker]["asset"] = self.coin_data["asset"]
 
     def get_links(self):
         if "links" in self.coin_data:
-            self.data[self.ticker].update({"links": self.coin_data["links"]})
+            self.data[self.ticker]["links"] = self.coin_data["links"]
 
     def get_hd_info(self):
+        d = self.data[self.ticker]
         if "derivation_path" in self.coin_data:
-            self.data[self.ticker].update(
-                {"derivation_path": self.coin_data["derivation_path"]}
-            )
+            d["derivation_path"] = self.coin_data["derivation_path"]
         if "trezor_coin" in self.coin_data:
-            self.data[self.ticker].update(
-                {"trezor_coin": self.coin_data["trezor_coin"]}
-            )
+            d["trezor_coin"] = self.coin_data["trezor_coin"]
 
     def get_rewards_info(self):
         if self.ticker in ["KMD"]:
@@ -332,13 +330,12 @@ class CoinConfig:
             )
 
     def get_address_format(self):
+        d = self.data[self.ticker]
         if "address_format" in self.coin_data:
-            self.data[self.ticker].update(
-                {"address_format": self.coin_data["address_format"]}
-            )
+            d["address_format"] = self.coin_data["address_format"]
 
-        if self.ticker.find("-segwit") > -1:
-            self.data[self.ticker].update({"address_format": {"format": "segwit"}})
+        if "-segwit" in self.ticker:
+            d["address_format"] = {"format": "segwit"}
 
     def is_smartchain(self):
         if "sign_message_prefix" in self.coin_data:
@@ -347,9 +344,7 @@ class CoinConfig:
 
     def is_wallet_only(self):
         if "wallet_only" in self.coin_data:
-            self.data[self.ticker].update(
-                {"wallet_only": self.coin_data["wallet_only"]}
-            )
+            self.data[self.ticker]["wallet_only"] = self.coin_data["wallet_only"]
 
     def get_parent_coin(self):
         """Used for getting filename for related coins/ethereum folder"""
@@ -358,43 +353,45 @@ class CoinConfig:
             return "RSK"
 
         if self.coin_type in ["TENDERMINTTOKEN", "TENDERMINT"]:
-            for i in ["IRISTEST", "NUCLEUSTEST"]:
-                if self.ticker.find(i) > -1:
+            for i in TENDERMINT_TESTNET_PARENTS:
+                if i in self.ticker:
                     self.is_testnet = True
                     return i
-            for i in ["IBC_IRIS", "IBC_ATOM", "IBC_OSMO"]:
-                if self.ticker.find(i) > -1:
+            for i in TENDERMINT_IBC_PARENTS:
+                if i in self.ticker:
                     return i.replace("IBC_", "")
 
         if self.coin_type not in ["UTXO", "ZHTLC", "BCH", "QTUM", "SIA"]:
             if self.data[self.ticker]["is_testnet"]:
-                key_list = list(self.testnet_protocols.keys())
-                value_list = list(self.testnet_protocols.values())
+                protocols = TESTNET_PROTOCOLS
+                parents = TESTNET_PROTOCOL_PARENTS
             else:
-                key_list = list(self.protocols.keys())
-                value_list = list(self.protocols.values())
-            if self.ticker in key_list:
+                protocols = PROTOCOLS
+                parents = PROTOCOL_PARENTS
+            if self.ticker in protocols:
                 return self.ticker
 
             if self.ticker == "RBTC":
                 token_type = "RSK Smart Bitcoin"
-            if token_type in value_list:
-                i = value_list.index(token_type)
-                return key_list[i]
-            logger.warning(f"{token_type} not in value_list")
+            parent = parents.get(token_type)
+            if parent is not None:
+                return parent
+            logger.warning(f"{token_type} not in protocols")
         return None
 
     def clean_name(self):
-        self.data[self.ticker].update({"name": self.coin_data["fname"]})
+        self.data[self.ticker]["name"] = self.coin_data["fname"]
 
     def get_generics(self):
+        d = self.data[self.ticker]
         for i in self.coin_data:
-            if i not in self.data[self.ticker]:
-                self.data[self.ticker].update({i: self.coin_data[i]})
+            if i not in d:
+                d[i] = self.coin_data[i]
 
     def get_electrums(self):
-        coin = self.ticker.replace("-segwit", "")
-        if self.data[self.ticker]["type"] == "QRC-20":
+        d = self.data[self.ticker]
+        coin = self.no_segwit_ticker
+        if d["type"] == "QRC-20":
             if self.is_testnet:
                 coin = "tQTUM"
             else:
@@ -403,137 +400,206 @@ class CoinConfig:
         if not coin in electrum_coins:
             logger.warning(f"{coin} not found in electrum_coins")
             return
-        with open(f"{repo_path}/electrums/{coin}", "r") as f:
-            electrums = json.load(f)
+        electrums = load_json(f"{repo_path}/electrums/{coin}")
                 
-        if coin in electrum_scan_report:
+        if coin in self.electrum_scan_report:
+            # Index entries by the url/ws_url the scan report is keyed on,
+            # keeping file order so duplicates come out as before.
+            by_url = {}
+            for electrum in electrums:
+                if "url" in electrum:
+                    by_url.setdefault(electrum["url"], []).append((electrum, False))
+                if "ws_url" in electrum:
+                    by_url.setdefault(electrum["ws_url"], []).append((electrum, True))
+
             valid_electrums = []
             for x in ["tcp", "ssl", "wss"]:
                 # This also filers ws with tcp/ssl server it is grouped with if valid.
-                for k, v in electrum_scan_report[coin][x].items():
+                for k, v in self.electrum_scan_report[coin][x].items():
                     if (
                         current_time - v["last_connection"] < 604800
                     ):  # 1 week grace period
-                        for electrum in electrums:
-                            electrum["protocol"] = x.upper()
-                            e = deepcopy(electrum)
-                            if "url" in e:
-                                if e["url"] == k:
-                                    if "ws_url" in e:
-                                        del e["ws_url"]
-                                    valid_electrums.append(e)
-                            e = deepcopy(electrum)
-                            if "ws_url" in e:
+                        for electrum, is_ws in by_url.get(k, []):
+                            # Entries are flat apart from contact info, which
+                            # is never modified, so a shallow copy is enough.
+                            e = electrum.copy()
+                            if is_ws:
                                 e["protocol"] = "WSS"
-                                if e["ws_url"] == k:
-                                    e["url"] = k
-                                    del e["ws_url"]
-                                    valid_electrums.append(e)
+                                e["url"] = k
+                            else:
+                                e["protocol"] = x.upper()
+                            e.pop("ws_url", None)
+                            valid_electrums.append(e)
             if len(valid_electrums) > 0:
                 valid_electrums = sort_dicts_list(valid_electrums, "url")                 
-            self.data[self.ticker].update({"electrum": valid_electrums})
+            d["electrum"] = valid_electrums
         elif self.coin_type in ["SIA"]:
-            self.data[self.ticker].update({"nodes": electrums})
+            d["nodes"] = electrums
 
     def get_swap_contracts(self):
-        contract_data = None
+        d = self.data[self.ticker]
+        contract_path = None
 
         if self.ticker in ethereum_coins:
-            with open(f"{repo_path}/ethereum/{self.ticker}", "r") as f:
-                contract_data = json.load(f)
+            contract_path = f"{repo_path}/ethereum/{self.ticker}"
 
-        elif self.data[self.ticker]["type"] in ["TENDERMINT", "TENDERMINTTOKEN"]:
-            with open(f"{repo_path}/tendermint/{self.parent_coin}", "r") as f:
-                contract_data = json.load(f)
+        elif d["type"] in ["TENDERMINT", "TENDERMINTTOKEN"]:
+            contract_path = f"{repo_path}/tendermint/{self.parent_coin}"
 
         elif self.ticker not in electrum_coins:
             if self.parent_coin not in [None]:
-                with open(f"{repo_path}/ethereum/{self.parent_coin}", "r") as f:
-                    contract_data = json.load(f)
+                contract_path = f"{repo_path}/ethereum/{self.parent_coin}"
 
+        contract_data = load_json(contract_path) if contract_path else None
         if contract_data:
             if "swap_contract_address" in contract_data:
-                self.data[self.ticker].update(
-                    {"swap_contract_address": contract_data["swap_contract_address"]}
-                )
+                d["swap_contract_address"] = contract_data["swap_contract_address"]
             if "fallback_swap_contract" in contract_data:
-                self.data[self.ticker].update(
-                    {"fallback_swap_contract": contract_data["fallback_swap_contract"]}
-                )
+                d["fallback_swap_contract"] = contract_data["fallback_swap_contract"]
             if "rpc_nodes" in contract_data:
-                if self.data[self.ticker]["type"] in ["TENDERMINT", "TENDERMINTTOKEN"]:
+                if d["type"] in ["TENDERMINT", "TENDERMINTTOKEN"]:
                     key = "rpc_urls"
                 else:
                     key = "nodes"
                     
-                values = sort_dicts_list(contract_data["rpc_nodes"], "url")       
-                self.data[self.ticker].update({key: values})
+                d[key] = list(load_rpc_nodes(contract_path))
 
     def get_explorers(self):
+        d = self.data[self.ticker]
         explorers = None
-        coin = self.ticker.replace("-segwit", "")
+        coin = self.no_segwit_ticker
         if coin in explorer_coins:
-            with open(f"{repo_path}/explorers/{coin}", "r") as f:
-                explorers = json.load(f)
+            explorers = load_json(f"{repo_path}/explorers/{coin}")
 
         elif self.parent_coin in explorer_coins:
-            with open(f"{repo_path}/explorers/{self.parent_coin}", "r") as f:
-                explorers = json.load(f)
+            explorers = load_json(f"{repo_path}/explorers/{self.parent_coin}")
 
         if explorers:
             for x in explorers:
                 for p in explorer_paths:
-                    if x.find(p) > -1:
-                        self.data[self.ticker].update(explorer_paths[p])
+                    if p in x:
+                        d.update(explorer_paths[p])
                         break
 
-            self.data[self.ticker].update({"explorer_url": explorers[0]})
+            d["explorer_url"] = explorers[0]
             for i in [
                 ("explorer_tx_url", "tx/"),
                 ("explorer_address_url", "address/"),
                 ("explorer_block_url", "block/"),
             ]:
-                if i[0] not in self.data[self.ticker]:
-                    self.data[self.ticker].update({i[0]: i[1]})
-                elif self.data[self.ticker][i[0]] == "":
-                    self.data[self.ticker].update({i[0]: i[1]})
+                if i[0] not in d:
+                    d[i[0]] = i[1]
+                elif d[i[0]] == "":
+                    d[i[0]] = i[1]
+
+
+def build_coin_config(item, electrum_scan_report):
+    config = CoinConfig(item, electrum_scan_report)
+    config.get_generics()
+    config.get_protocol_info()
+    config.clean_name()
+    config.get_swap_contracts()
+    config.get_electrums()
+    config.get_explorers()
+    config.is_smartchain()
+    config.is_wallet_only()
+    config.get_address_format()
+    config.get_rewards_info()
+    config.get_alias_ticker()
+    config.get_asset()
+    config.get_forex_id()
+    config.get_coinpaprika_id()
+    config.get_coingecko_id()
+    config.get_livecoinwatch_id()
+    config.get_binance_id()
+    config.get_hd_info()
+    config.get_links()
+    return config.data
+
+
+def get_coins_config_cache_key(electrum_scan_report):
+    """Hash of everything parse_coins_repo reads, by file size and mtime."""
+    paths = [f"{repo_path}/coins", f"{repo_path}/explorers/explorer_paths.json", __file__]
+    for folder in ["electrums", "ethereum", "tendermint", "explorers", "light_wallet_d", "api_ids"]:
+        paths += sorted(f"{repo_path}/{folder}/{f}" for f in list_files(f"{repo_path}/{folder}"))
+    key = hashlib.blake2b()
+    for path in paths:
+        stat = os.stat(path)
+        key.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    key.update(pickle.dumps(electrum_scan_report))
+    return key.hexdigest()
+
+
+def get_scan_report_expiry(electrum_scan_report):
+    """Time at which the next electrum drops out of the 1 week grace period."""
+    expiry = math.inf
+    for coin in electrum_scan_report.values():
+        for x in ["tcp", "ssl", "wss"]:
+            for v in coin.get(x, {}).values():
+                if current_time - v["last_connection"] < 604800:
+                    expiry = min(expiry, v["last_connection"] + 604800)
+    return expiry
+
+
+def load_coins_config_cache(key):
+    try:
+        with open(coins_config_cache_path, "rb") as f:
+            cache = pickle.load(f)
+        if cache["key"] != key or current_time >= cache["expiry"]:
+            return None
+        return cache["coins_config"], cache["nodata"], cache["errors"]
+    except Exception:
+        # A missing, stale format or corrupt cache is just a cache miss
+        return None
+
 
+def save_coins_config_cache(key, expiry, coins_config, nodata, errors):
+    cache = {"key": key, "expiry": expiry, "coins_config": coins_config, "nodata": nodata, "errors": errors}
+    try:
+        with open(coins_config_cache_path, "wb") as f:
+            pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        logger.warning(f"Failed to save coins config cache: {e}")
+
+
+def log_coins_config_report(coins_config, nodata, errors):
+    for coin in coins_config:
+        if not coins_config[coin]["explorer_url"]:
+            logger.warning(f"{coin} has no explorers!")
 
-def parse_coins_repo(electrum_scan_report):
+    logger.warning(
+        f"The following coins are missing required data or failing connections for nodes/electrums {nodata}"
+    )
+    logger.warning(f"They will not be included in the output")
+    if errors:
+        logger.error(f"Errors:")
+        for error in errors:
+            logger.error(error)
+
+
+def parse_coins_repo(electrum_scan_report, use_cache=True):
     ensure_chainids()
+    if use_cache:
+        cache_key = get_coins_config_cache_key(electrum_scan_report)
+        cached = load_coins_config_cache(cache_key)
+        if cached:
+            logger.info(f"Inputs unchanged, using cached coins config from {coins_config_cache_path}")
+            coins_config, nodata, errors = cached
+            # Repeat the diagnostics of the run that filled the cache
+            log_coins_config_report(coins_config, nodata, errors)
+            return coins_config, nodata
+
     errors = []
     coins_config = {}
-    with open(f"{repo_path}/coins", "r") as f:
-        coins_data = json.load(f)
+    coins_data = read_json(f"{repo_path}/coins")
 
+    # Coins are built independently of each other. With the sidecar files
+    # cached this is cheaper than starting a process pool would be.
     for item in coins_data:
-        config = CoinConfig(item, electrum_scan_report)
-        config.get_generics()
-        config.get_protocol_info()
-        config.clean_name()
-        config.get_swap_contracts()
-        config.get_electrums()
-        config.get_explorers()
-        config.is_smartchain()
-        config.is_wallet_only()
-        config.get_address_format()
-        config.get_rewards_info()
-        config.get_alias_ticker()
-        config.get_asset()
-        config.get_forex_id()
-        config.get_coinpaprika_id()
-        config.get_coingecko_id()
-        config.get_livecoinwatch_id()
-        config.get_binance_id()
-        config.get_hd_info()
-        config.get_links()
-        coins_config.update(config.data)
+        coins_config.update(build_coin_config(item, electrum_scan_report))
 
     nodata = []
     for coin in coins_config:
-        if not coins_config[coin]["explorer_url"]:
-            logger.warning(f"{coin} has no explorers!")
-        
         for field in ["nodes", "electrum", "light_wallet_d_servers", "rpc_urls"]:
             if field in coins_config[coin]:
                 if not coins_config[coin][field]:
@@ -545,14 +611,10 @@ def parse_coins_repo(electrum_scan_report):
         ):
             nodata.append(coin)
 
-    logger.warning(
-        f"The following coins are missing required data or failing connections for nodes/electrums {nodata}"
-    )
-    logger.warning(f"They will not be included in the output")
-    if errors:
-        logger.error(f"Errors:")
-        for error in errors:
-            logger.error(error)
+    log_coins_config_report(coins_config, nodata, errors)
+    if use_cache:
+        expiry = get_scan_report_expiry(electrum_scan_report)
+        save_coins_config_cache(cache_key, expiry, coins_config, nodata, errors)
     return coins_config, nodata
 
 
@@ -569,35 +631,26 @@ def get_desktop_repo_coins_data():
 
 
 def filter_ssl(coins_config):
+    # Each coin gets its own top level dict, so coins_config is left untouched.
     coins_config_ssl = {}
-    for coin in coins_config:
-        coins_config_ssl.update({coin: coins_config[coin]})
-        if "electrum" in coins_config[coin]:
-            electrums = []
-            for i in coins_config[coin]["electrum"]:
-                if "protocol" in i:
-                    if i["protocol"] == "SSL":
-                        electrums.append(i)
-            if len(coins_config_ssl[coin]["electrum"]) == 0:
-                del coins_config_ssl[coin]
-            else:
-                electrums = filter_duplicate_domains(electrums)
-                coins_config_ssl[coin]["electrum"] = electrums
-
-        if "nodes" in coins_config[coin]:
-            coins_config_ssl[coin]["nodes"] = [
-                i for i in coins_config[coin]["nodes"] if i["url"].startswith("https")
+    for coin, cfg in coins_config.items():
+        cfg = {**cfg}
+        if "electrum" in cfg:
+            electrums = [i for i in cfg["electrum"] if i.get("protocol") == "SSL"]
+            if len(electrums) == 0:
+                continue
+            cfg["electrum"] = filter_duplicate_domains(electrums)
+
+        if "nodes" in cfg:
+            cfg["nodes"] = [i for i in cfg["nodes"] if i["url"].startswith("https")]
+
+        if "light_wallet_d_servers" in cfg:
+            cfg["light_wallet_d_servers"] = [
+                i for i in cfg["light_wallet_d_servers"] if i.startswith("https")
             ]
+        coins_config_ssl[coin] = cfg
 
-        if "light_wallet_d_servers" in coins_config[coin]:
-            coins_config_ssl[coin]["light_wallet_d_servers"] = [
-                i
-                for i in coins_config[coin]["light_wallet_d_servers"]
-                if i.startswith("https")
-            ]
-
-    with open(f"{script_path}/coins_config_ssl.json", "w+") as f:
-        json.dump(coins_config_ssl, f, indent=4)
+    write_json(f"{script_path}/coins_config_ssl.json", coins_config_ssl)
     return coins_config_ssl
 
 
@@ -615,37 +668,38 @@ def item_exists(i, electrums):
 def filter_duplicate_domains(electrums):
     domains = {}
     for i in electrums:
-        domain = i["url"].split(":")[0]
+        domain = i["url"].split(":", 1)[0]
         if domain not in domains:
             domains.update({domain: {i['protocol']: i['url']}})
         else:
             domains[domain].update({i['protocol']: i['url']})
-    for i in domains:
-        if "SSL" in domains[i] and "TCP" in domains[i]:
-            for e in electrums:
-                if e["url"].startswith(i) and e["protocol"] == "TCP":
-                    electrums.remove(e)
-    return electrums
+    # Prefer SSL, drop TCP for domains which offer both
+    drop = {
+        (domain, "TCP")
+        for domain, protocols in domains.items()
+        if "SSL" in protocols and "TCP" in protocols
+    }
+    return [
+        e for e in electrums
+        if (e["url"].split(":", 1)[0], e["protocol"]) not in drop
+    ]
     
 
     
 
 def filter_tcp(coins_config, coins_config_ssl):
     coins_config_tcp = {}
-    for coin in coins_config:
-        coins_config_tcp.update({coin: coins_config[coin]})
+    for coin, cfg in coins_config.items():
+        cfg = {**cfg}
         # Omit komodo_proxy: true nodes - these are web only.
-        if "nodes" in coins_config[coin]:
-            coins_config_tcp[coin]["nodes"] = [
-                i for i in coins_config[coin]["nodes"] if "komodo_proxy" not in i
-            ]
-        if "electrum" in coins_config[coin]:
+        if "nodes" in cfg:
+            cfg["nodes"] = [i for i in cfg["nodes"] if "komodo_proxy" not in i]
+        if "electrum" in cfg:
             electrums = []
             # Prefer SSL
             if coin in coins_config_ssl:
-                if len(coins_config_ssl[coin]["electrum"]) > 0:
-                    electrums = coins_config_ssl[coin]["electrum"]
-            for i in coins_config[coin]["electrum"]:
+                electrums = list(coins_config_ssl[coin].get("electrum", []))
+            for i in cfg["electrum"]:
                 if "komodo_proxy" in i:
                     if i["komodo_proxy"] == True:
                         continue
@@ -657,64 +711,58 @@ def filter_tcp(coins_config, coins_config_ssl):
                     else:
                         electrums.append(i)
 
-            if len(coins_config_tcp[coin]["electrum"]) == 0:
-                del coins_config_tcp[coin]
-            else:
-                electrums = filter_duplicate_domains(electrums)
-                coins_config_tcp[coin]["electrum"] = electrums
+            if len(electrums) == 0:
+                continue
+            cfg["electrum"] = filter_duplicate_domains(electrums)
+        coins_config_tcp[coin] = cfg
 
-    with open(f"{script_path}/coins_config_tcp.json", "w+") as f:
-        json.dump(coins_config_tcp, f, indent=4)
+    write_json(f"{script_path}/coins_config_tcp.json", coins_config_tcp)
     return coins_config_tcp
 
 
 def filter_wss(coins_config):
     coins_config_wss = {}
-    for coin in coins_config:
-        if "electrum" in coins_config[coin]:
+    for coin, cfg in coins_config.items():
+        if "electrum" in cfg:
             electrums = []
-            for i in coins_config[coin]["electrum"]:
+            for i in cfg["electrum"]:
                 if "protocol" in i:
                     if i["protocol"] == "WSS":
                         electrums.append(i)
                 else:
                     logger.warning(f"No protocol data in {i}")
             if len(electrums) > 0:
-                coins_config_wss.update({coin: coins_config[coin]})
-                coins_config_wss[coin]["electrum"] = electrums
-        elif "nodes" in coins_config[coin]:
-            nodes = []
-            for i in coins_config[coin]["nodes"]:
-                if "ws_url" in i:
-                    nodes.append(i)
+                coins_config_wss[coin] = {**cfg, "electrum": electrums}
+        elif "nodes" in cfg:
+            nodes = [i for i in cfg["nodes"] if "ws_url" in i]
             if len(nodes) > 0:
-                coins_config_wss.update({coin: coins_config[coin]})
-                coins_config_wss[coin]["nodes"] = nodes
+                coins_config_wss[coin] = {**cfg, "nodes": nodes}
         else:
             logger.warning(f"{coin} not checked for WSS filter yet, including anyway.")
-            coins_config_wss.update({coin: coins_config[coin]})
+            coins_config_wss[coin] = cfg
 
-    with open(f"{script_path}/coins_config_wss.json", "w+") as f:
-        json.dump(coins_config_wss, f, indent=4)
+    write_json(f"{script_path}/coins_config_wss.json", coins_config_wss)
     return coins_config_wss
 
 
+def split_binance_symbol(symbol):
+    """Returns a (base, quote) tuple, or the symbol itself if no quote matches."""
+    match = BINANCE_SYMBOL_RE.fullmatch(symbol)
+    if match is None:
+        return symbol
+    quote = binance_quote_tickers[(match.lastindex - 1) // 2]
+    if match.lastindex % 2:
+        return (quote, symbol.replace(quote, ""))
+    return (symbol.replace(quote, ""), quote)
+
+
 def generate_binance_api_ids(coins_config):
     kdf_coins = coins_config.keys()
     r = requests.get("https://defi-stats.komodo.earth/api/v3/binance/ticker_price")
     binance_tickers = r.json()
     pairs = []
     for ticker in binance_tickers:
-        pair = ticker["symbol"]
-        for quote in binance_quote_tickers:
-            if ticker["symbol"].startswith(quote):
-                pair = (quote, ticker["symbol"].replace(quote, ""))
-                break
-            elif ticker["symbol"].endswith(quote):
-                pair = (ticker["symbol"].replace(quote, ""), quote)
-                break
-            
-        pairs.append(pair)
+        pairs.append(split_binance_symbol(ticker["symbol"]))
     unknown_ids = [i for i in pairs if isinstance(i, str)]
     known_ids = [i for i in pairs if isinstance(i, tuple)]
 
@@ -729,8 +777,7 @@ def generate_binance_api_ids(coins_config):
             if ticker not in BINANCE_DELISTED_COINS and ticker not in MISMATCHED_IDS:
                 api_ids.update({coin: ticker})
 
-    with open(f"{repo_path}/api_ids/binance_ids.json", "w") as f:
-        json.dump(api_ids, f, indent=4)
+    write_json(f"{repo_path}/api_ids/binance_ids.json", api_ids)
 
     # To use for candlestick data, reference api_ids/binance_ids.json
     # to get the base and quote id for a pair then concatentate them with no separator
@@ -739,16 +786,18 @@ def generate_binance_api_ids(coins_config):
 
 
 def sort_dict(d):
-    return {k: d[k] for k in sorted(d)}
+    return dict(sorted(d.items()))
 
 def sort_dicts_list(data, sort_key):
-    return sorted(data, key=lambda x: x[sort_key])
+    return sorted(data, key=itemgetter(sort_key))
 
 
+@lru_cache(maxsize=4096)
 def normalize_coin_name(name):
     """
-    Remove common protocol suffixes from coin names for better icon matching.
-    Also splits by separators and uses first part for broader matching.
+    Reduce coin names to their base for broader icon matching, by taking the
+    part before the first "-" separator, or else before the first "_".
+    Protocol suffixes always come after a separator, so this also drops them.
     Examples: 
     - "BABYDOGE-BEP20" -> "babydoge"
     - "babydoge_bep20" -> "babydoge"
@@ -756,35 +805,65 @@ def normalize_coin_name(name):
     - "SOME-COMPLEX_NAME" -> "some"
     """
     name = name.lower()
-    original_name = name
-    
-    # First try specific protocol suffix removal
-    suffixes_to_remove = [
-        # Dash-separated suffixes
-        '-bep20', '-erc20', '-plg20', '-avx20', '-krc20', '-ftm20', '-hrc20', 
-        '-qrc20', '-arb20', '-test', '-testnet',
-        # Underscore-separated suffixes  
-        '_bep20', '_erc20', '_plg20', '_avx20', '_krc20', '_ftm20', '_hrc20',
-        '_qrc20', '_arb20', '_test', '_testnet'
-    ]
-    
-    for suffix in suffixes_to_remove:
-        if name.endswith(suffix):
-            name = name[:-len(suffix)]
-            break
-    
-    # Also try splitting by separators and using first part
-    # This catches any prefix before - or _ separators
     for separator in ['-', '_']:
-        if separator in original_name:
-            first_part = original_name.split(separator)[0]
-            # Return the shorter/more general version between suffix removal and first part
-            if len(first_part) <= len(name):
-                return first_part
-    
+        if separator in name:
+            return name.split(separator, 1)[0]
     return name
 
 
+def process_sprite_icon(icon_path, icon_size):
+    """
+    Load an icon as an icon_size x icon_size RGBA image, padding it to keep its
+    aspect ratio. Returns (image, was_rgba, was_resized).
+    """
+    # Image.open only parses the PNG header, so reading the size here is as
+    # cheap as peeking at IHDR ourselves; pixels are decoded by load()/convert()
+    with Image.open(icon_path) as icon:
+        original_width, original_height = icon.size
+
+        # Skip format conversion if already RGBA (common for oxipng optimized PNGs)
+        was_rgba = icon.mode == 'RGBA'
+        if was_rgba:
+            icon.load()
+        else:
+            icon = icon.convert('RGBA')
+
+        # Fast path for correctly sized images (skip all processing)
+        if original_width == icon_size and original_height == icon_size:
+            # Image is already perfect size, no processing needed
+            return icon, was_rgba, False
+
+        # Use padding instead of stretching to maintain aspect ratio
+        aspect_ratio = original_width / original_height
+
+        if aspect_ratio > 1:  # Wider than tall
+            new_width = min(icon_size, original_width)
+            new_height = int(new_width / aspect_ratio)
+        else:  # Taller than wide or square
+            new_height = min(icon_size, original_height)
+            new_width = int(new_height * aspect_ratio)
+
+        # Only resize if different from original (avoid unnecessary processing)
+        # Icons are only ever shrunk here: integer ratios are averaged exactly
+        # with BOX, anything else uses BILINEAR after a reducing_gap box pre-pass
+        if new_width != original_width or new_height != original_height:
+            if original_width % new_width == 0 and original_height % new_height == 0:
+                icon = icon.resize((new_width, new_height), Image.Resampling.BOX)
+            else:
+                icon = icon.resize((new_width, new_height), Image.Resampling.BILINEAR, reducing_gap=3.0)
+
+        # Create transparent canvas and center the image
+        canvas = Image.new('RGBA', (icon_size, icon_size), (0, 0, 0, 0))
+        paste_x = (icon_size - new_width) // 2
+        paste_y = (icon_size - new_height) // 2
+        canvas.paste(icon, (paste_x, paste_y))
+
+        if original_width < icon_size or original_height < icon_size:
+            icon_file = os.path.basename(icon_path)
+            logger.info(f"Icon {icon_file} padded from {original_width}x{original_height} to {icon_size}x{icon_size} (resized to {new_width}x{new_height})")
+        return canvas, was_rgba, True
+
+
 def generate_spritemap():
     icon_size = 128
     icons_dir = f"{repo_path}/icons"
@@ -792,8 +871,7 @@ def generate_spritemap():
     spritemap_json_path = f"{script_path}/spritemap.json"
 
     # Read coins file directly
-    with open(f"{repo_path}/coins", "r") as f:
-        coins_data = json.load(f)
+    coins_data = read_json(f"{repo_path}/coins")
     
     # Get all coin tickers and names from the coins file
     coin_tickers = set()
@@ -838,52 +916,35 @@ def generate_spritemap():
                 coin_fnames.add(normalized_fname)
                 icon_name_to_ticker[normalized_fname] = ticker
     
-    # Get available icons
-    available_icons = [f for f in os.listdir(icons_dir) if f.endswith('.png') and f != 'spritemap.png']
+    # Get available icons, keeping each file's path and lowercased name
+    available_icons = {}
+    with os.scandir(icons_dir) as it:
+        for entry in it:
+            if entry.name.endswith('.png') and entry.name != 'spritemap.png' and entry.is_file():
+                available_icons[entry.name] = (entry.path, os.path.splitext(entry.name)[0].lower())
     
-    # Filter icons to match coin tickers, names, or fnames
+    # Split icons into those matching a coin ticker, name, or fname and the rest
+    coin_values = coin_tickers | coin_names | coin_fnames
     icons = []
-    for icon_file in available_icons:
-        icon_name = os.path.splitext(icon_file)[0].lower()
-        # Try to match by ticker first, then by name, then by fname
-        if icon_name in coin_tickers or icon_name in coin_names or icon_name in coin_fnames:
+    icons_not_included = []
+    for icon_file, (_, icon_name) in available_icons.items():
+        if icon_name in coin_values:
             icons.append(icon_file)
+        else:
+            icons_not_included.append(icon_file)
     
     # Sort alphabetically
     icons.sort()
+    included_icon_names = coin_values.intersection(icon_name for _, icon_name in available_icons.values())
     
-    # Track unmatched items for reporting
+    # Track unmatched items for reporting, sorted for consistent output
     unmatched_report = {
-        'icons_not_included': [],
-        'coin_values_without_direct_icons_match': [],
-        'names_without_direct_icons_match': [],
-        'fnames_without_direct_icons_match': []
+        'icons_not_included': sorted(icons_not_included),
+        'coin_values_without_direct_icons_match': sorted(coin_tickers - included_icon_names),
+        'names_without_direct_icons_match': sorted(coin_names - included_icon_names),
+        'fnames_without_direct_icons_match': sorted(coin_fnames - included_icon_names)
     }
     
-    # Find icons that weren't included (exist but don't match any coin)
-    included_icon_names = {os.path.splitext(icon)[0].lower() for icon in icons}
-    for icon_file in available_icons:
-        icon_name = os.path.splitext(icon_file)[0].lower()
-        if icon_name not in included_icon_names:
-            unmatched_report['icons_not_included'].append(icon_file)
-    
-    # Find coin data that doesn't have matching icons
-    for coin_ticker in coin_tickers:
-        if coin_ticker not in included_icon_names:
-            unmatched_report['coin_values_without_direct_icons_match'].append(coin_ticker)
-    
-    for coin_name in coin_names:
-        if coin_name not in included_icon_names:
-            unmatched_report['names_without_direct_icons_match'].append(coin_name)
-    
-    for coin_fname in coin_fnames:
-        if coin_fname not in included_icon_names:
-            unmatched_report['fnames_without_direct_icons_match'].append(coin_fname)
-    
-    # Sort all unmatched lists for consistent output
-    for key in unmatched_report:
-        unmatched_report[key].sort()
-    
     logger.info(f"Coin tickers from coins file: {len(coin_tickers)} (first 10): {sorted(list(coin_tickers))[:10]}")
     logger.info(f"Coin names from coins file: {len(coin_names)} (first 10): {sorted(list(coin_names))[:10]}")
     logger.info(f"Coin fnames from coins file: {len(coin_fnames)} (first 10): {sorted(list(coin_fnames))[:10]}")  # Add logging for fnames
@@ -899,8 +960,7 @@ def generate_spritemap():
     #Save unmatched report to JSON file
     unmatched_report_path = f"{script_path}/spritemap_unmatched_report.json"
     try:
-        with open(unmatched_report_path, 'w') as f:
-            json.dump(unmatched_report, f, indent=4)
+        write_json(unmatched_report_path, unmatched_report)
         logger.info(f"Generated unmatched items report at {unmatched_report_path}")
     except Exception as e:
         logger.error(f"Failed to save unmatched report: {e}")
@@ -932,62 +992,38 @@ def generate_spritemap():
 
     processed_count = 0
     skipped_conversions = 0
-    for i, icon_file in enumerate(icons):
-        icon_path = os.path.join(icons_dir, icon_file)
-        try:
-            with Image.open(icon_path) as icon:
-                original_width, original_height = icon.size
-                
-                # Skip format conversion if already RGBA (common for oxipng optimized PNGs)
-                if icon.mode != 'RGBA':
-                    icon = icon.convert('RGBA')
-                else:
+    # Decoding and resizing release the GIL, so do them on a thread pool and
+    # only paste into the spritemap from this thread.
+    with ThreadPoolExecutor() as executor:
+        futures = {
+            executor.submit(process_sprite_icon, available_icons[icon_file][0], icon_size): i
+            for i, icon_file in enumerate(icons)
+        }
+        # Each icon has a fixed cell, so paste them in whatever order they finish
+        placed = set()
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                processed_icon, was_rgba, was_resized = future.result()
+                if was_rgba:
                     skipped_conversions += 1
-                
-                # Fast path for correctly sized images (skip all processing)
-                if original_width == icon_size and original_height == icon_size:
-                    # Image is already perfect size, no processing needed
-                    processed_icon = icon
-                else:
-                    # Use padding instead of stretching to maintain aspect ratio
-                    aspect_ratio = original_width / original_height
-                    
-                    if aspect_ratio > 1:  # Wider than tall
-                        new_width = min(icon_size, original_width)
-                        new_height = int(new_width / aspect_ratio)
-                    else:  # Taller than wide or square
-                        new_height = min(icon_size, original_height)
-                        new_width = int(new_height * aspect_ratio)
-                    
-                    # Only resize if different from original (avoid unnecessary processing)
-                    if new_width != original_width or new_height != original_height:
-                        icon = icon.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                    
-                    # Create transparent canvas and center the image
-                    canvas = Image.new('RGBA', (icon_size, icon_size), (0, 0, 0, 0))
-                    paste_x = (icon_size - new_width) // 2
-                    paste_y = (icon_size - new_height) // 2
-                    canvas.paste(icon, (paste_x, paste_y), icon)
-                    processed_icon = canvas
-                    
-                    if original_width < icon_size or original_height < icon_size:
-                        logger.info(f"Icon {icon_file} padded from {original_width}x{original_height} to {icon_size}x{icon_size} (resized to {new_width}x{new_height})")
+                if was_resized:
                     processed_count += 1
-                
+
                 x = (i % grid_cols) * icon_size
                 y = (i // grid_cols) * icon_size
-                spritemap.paste(processed_icon, (x, y), processed_icon)  # Use icon as mask for proper alpha blending
-                
-                icon_name = os.path.splitext(icon_file)[0]  # Remove .png extension
-                coordinates[icon_name] = {
-                    'x': x,
-                    'y': y,
-                    'width': icon_size,
-                    'height': icon_size
-                }
-        except Exception as e:
-            logger.warning(f"Failed to process icon {icon_file}: {e}")
+                spritemap.paste(processed_icon, (x, y))  # Cells start fully transparent, so copy the icon as is
+                placed.add(i)
+            except Exception as e:
+                logger.warning(f"Failed to process icon {icons[i]}: {e}")
+
+    # Record coordinates in icon order to keep the JSON output stable
+    for i, icon_file in enumerate(icons):
+        if i not in placed:
             failed_icons.append(icon_file)
+            continue
+        icon_name = os.path.splitext(icon_file)[0]  # Remove .png extension
+        coordinates[icon_name] = ((i % grid_cols) * icon_size, (i // grid_cols) * icon_size)
 
     if failed_icons:
         logger.warning(f"Failed to process {len(failed_icons)} icons: {failed_icons}")
@@ -995,28 +1031,36 @@ def generate_spritemap():
     # Log optimization stats
     logger.info(f"Processed {processed_count} icons (resized/padded), skipped format conversion for {skipped_conversions} already-RGBA icons")
 
-    # Save with minimal compression since input images are already oxipng optimized
-    # Using compress_level=1 for faster processing while still getting some compression
+    # oxipng recompresses the spritemap from scratch, so when it is available
+    # save it uncompressed; otherwise compress_level=1 is the final output
+    oxipng_path = shutil.which('oxipng')
     try:
-        spritemap.save(spritemap_img_path, 'PNG', optimize=False, compress_level=1)
+        spritemap.save(spritemap_img_path, 'PNG', optimize=False, compress_level=0 if oxipng_path else 1)
         logger.info(f"Generated spritemap at {spritemap_img_path} (input images already oxipng optimized)")
-        
-        # Run oxipng on the final spritemap for maximum optimization
-        try:
-            import subprocess
-            result = subprocess.run(['oxipng', '-o', '6', '--strip', 'safe', spritemap_img_path], 
-                                  capture_output=True, text=True, timeout=120)
-            if result.returncode == 0:
-                logger.info(f"Post-processed spritemap with oxipng for optimal compression")
-            else:
-                logger.info(f"oxipng not available or failed, using PIL compression only")
-        except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError) as e:
-            logger.info(f"oxipng post-processing skipped (not available or failed): {e}")
-            
     except Exception as e:
         logger.error(f"Failed to save spritemap: {e}")
         return
-        
+
+    def save_pil_compressed(reason):
+        # The uncompressed save above was only meant as oxipng input, so compress it with PIL instead
+        try:
+            spritemap.save(spritemap_img_path, 'PNG', optimize=False, compress_level=1)
+            logger.info(f"oxipng post-processing failed ({reason}), saved spritemap with PIL compression instead")
+        except Exception as e:
+            logger.error(f"oxipng post-processing failed ({reason}) and PIL re-save failed: {e}")
+
+    # Run oxipng on the final spritemap for maximum optimization, in the
+    # background while the coordinates are written
+    oxipng = None
+    if oxipng_path is None:
+        logger.info(f"oxipng not available, using PIL compression only")
+    else:
+        try:
+            oxipng = subprocess.Popen([oxipng_path, '-o', '6', '--strip', 'safe', spritemap_img_path],
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except (OSError, subprocess.SubprocessError) as e:
+            save_pil_compressed(e)
+
     # Save coordinates with metadata
     spritemap_data = {
         'metadata': {
@@ -1028,16 +1072,30 @@ def generate_spritemap():
             'spritemap_height': spritemap_height,
             'generated_at': int(current_time)
         },
-        'coordinates': coordinates
+        'coordinates': {
+            icon_name: {'x': x, 'y': y, 'width': icon_size, 'height': icon_size}
+            for icon_name, (x, y) in coordinates.items()
+        }
     }
     
     try:
-        with open(spritemap_json_path, 'w') as f:
-            json.dump(spritemap_data, f, indent=4)
+        write_json(spritemap_json_path, spritemap_data)
         logger.info(f"Generated spritemap coordinates at {spritemap_json_path}")
     except Exception as e:
         logger.error(f"Failed to save spritemap coordinates: {e}")
 
+    if oxipng is not None:
+        try:
+            returncode = oxipng.wait(timeout=120)
+            if returncode == 0:
+                logger.info(f"Post-processed spritemap with oxipng for optimal compression")
+            else:
+                save_pil_compressed(f"exit status {returncode}")
+        except subprocess.TimeoutExpired as e:
+            oxipng.kill()
+            oxipng.wait()
+            save_pil_compressed(e)
+
 
 if __name__ == "__main__":
     generate_spritemap_only = len(sys.argv) > 1 and "spritemap" in sys.argv
@@ -1057,24 +1115,19 @@ if __name__ == "__main__":
         if all_files_exist:
             try:
                 logger.info("Generating spritemap using existing config files...")
-                with open(f"{script_path}/coins_config.json", "r") as f:
-                    coins_config = json.load(f)
-                with open(f"{script_path}/coins_config_ssl.json", "r") as f:
-                    coins_config_ssl = json.load(f)
-                with open(f"{script_path}/coins_config_tcp.json", "r") as f:
-                    coins_config_tcp = json.load(f)
-                with open(f"{script_path}/coins_config_wss.json", "r") as f:
-                    coins_config_wss = json.load(f)
+                # generate_spritemap reads the coins file itself, so only check
+                # that the configs are not empty ("{}") instead of parsing them
+                config_sizes = [os.path.getsize(f) for f in config_files]
                 
                 # Validate that configs have data
-                if coins_config and (coins_config_ssl or coins_config_tcp or coins_config_wss):
+                if config_sizes[0] > 2 and any(size > 2 for size in config_sizes[1:]):
                     generate_spritemap()
                     logger.info("Spritemap generation completed successfully!")
                     sys.exit()
                 else:
                     logger.warning("Config files exist but appear to be empty, running full scan...")
                     
-            except (json.JSONDecodeError, KeyError) as e:
+            except OSError as e:
                 logger.warning(f"Error reading config files ({e}), running full scan to regenerate...")
         else:
             missing_files = [f for f in config_files if not os.path.exists(f)]
@@ -1087,28 +1140,26 @@ if __name__ == "__main__":
     if len(sys.argv) > 1:
         if sys.argv[1] == "no-scan":
             skip_scan = True
+    use_cache = "--no-cache" not in sys.argv
     if skip_scan is False:
         electrum_scan_report = get_electrums_report()
     else:
         # Use existing scan data
-        with open(f"{script_path}/electrum_scan_report.json", "r") as f:
-            electrum_scan_report = json.load(f)
+        electrum_scan_report = read_json(f"{script_path}/electrum_scan_report.json")
 
-    coins_config, nodata = parse_coins_repo(electrum_scan_report)
+    coins_config, nodata = parse_coins_repo(electrum_scan_report, use_cache)
     # Includes failing servers
-    with open(f"{script_path}/coins_config_unfiltered.json", "w+") as f:
-        json.dump(coins_config, f, indent=4)
+    write_json(f"{script_path}/coins_config_unfiltered.json", coins_config)
     generate_binance_api_ids(coins_config)
 
     # Remove failing servers
     for coin in nodata:
         del coins_config[coin]
-    with open(f"{script_path}/coins_config.json", "w+") as f:
-        json.dump(coins_config, f, indent=4)
+    write_json(f"{script_path}/coins_config.json", coins_config)
         
-    coins_config_ssl = filter_ssl(deepcopy(coins_config))
-    coins_config_wss = filter_wss(deepcopy(coins_config))
-    coins_config_tcp = filter_tcp(deepcopy(coins_config), coins_config_ssl)
+    coins_config_ssl = filter_ssl(coins_config)
+    coins_config_wss = filter_wss(coins_config)
+    coins_config_tcp = filter_tcp(coins_config, coins_config_ssl)
 
     for coin in coins_config:
         r = f"{coin}: [SSL {coin in coins_config_ssl}] [TCP {coin in coins_config_tcp}] [WSS {coin in coins_config_wss}]"
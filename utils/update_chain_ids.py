@@ -1,14 +1,25 @@
 #!/usr/bin/env python3
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+EVM_PROTOCOLS = frozenset(("ETH", "AVAX", "MATIC", "BNB", "KCS", "FTM", "HT"))
+
 # Load the JSON data from file
-with open('../coins', 'r') as f:
-    coins = json.load(f)
+if orjson is not None:
+    with open('../coins', 'rb') as f:
+        coins = orjson.loads(f.read())
+else:
+    with open('../coins', 'r') as f:
+        coins = json.load(f)
 
 # Process each coin in the list
 for coin in coins:
     protocol = coin.get("protocol", {})
-    if protocol.get("type") in ["ETH", "AVAX", "MATIC", "BNB", "KCS", "FTM", "HT"]:
+    if protocol.get("type") in EVM_PROTOCOLS:
         # Ensure protocol_data exists
         protocol_data = protocol.setdefault("protocol_data", {})
         # Duplicate chain_id if it exists at top level
@@ -16,7 +27,11 @@ for coin in coins:
             protocol_data["chain_id"] = coin["chain_id"]
 
 # Write the updated data back to file or print to stdout
-with open('../coins_updated', 'w') as f:
-    json.dump(coins, f, indent=2)
+if orjson is not None:
+    with open('../coins_updated', 'wb') as f:
+        f.write(orjson.dumps(coins, option=orjson.OPT_INDENT_2))
+else:
+    with open('../coins_updated', 'w', encoding='utf-8') as f:
+        json.dump(coins, f, indent=2, ensure_ascii=False)
 
 print("Transformation complete. Output saved to coins_updated")
\ No newline at end of file
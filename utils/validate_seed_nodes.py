@@ -6,6 +6,7 @@ This script validates the seed-nodes.json file located in the project root
 against the JSON schema defined in utils/seed_nodes_schema.json.
 """
 
+import argparse
 import json
 import sys
 import os
@@ -13,16 +14,28 @@ import asyncio
 import time
 import socket
 import ssl
+from collections import Counter, namedtuple
+from functools import lru_cache
 from pathlib import Path
 
 try:
     import jsonschema
-    from jsonschema import validate, ValidationError, SchemaError
+    from jsonschema import ValidationError, SchemaError
 except ImportError:
     print("Error: jsonschema package is required. Install it with:")
     print("pip install jsonschema")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 try:
     import websockets
 except ImportError:
@@ -30,37 +43,74 @@ except ImportError:
     print("pip install websockets")
     sys.exit(1)
 
+# Upper bound on simultaneous connectivity probes, to stay well clear of fd limits
+MAX_CONCURRENT_PROBES = 32
 
-def wss_port(netid, lp_rpcport=7783):
-    """Quick function to get WSS port from netid."""
-    """lp_rpcport is hardcoded to 7783 in kdf for calculating wss port"""
-    max_netid = (65535 - 40 - lp_rpcport) // 4
-    
-    if not (0 <= netid <= max_netid):
-        raise ValueError(f"NetID must be between 0 and {max_netid}")
+# Seconds a WSS probe waits for its plain TCP connect before giving up on the node
+WSS_TCP_GATE_TIMEOUT = 3
+
+# Pending or finished getaddrinfo lookups, keyed by host
+dns_cache = {}
+
+# SSL context with default verification, shared by every WSS probe so the CA
+# store is only loaded once
+ssl_context = ssl.create_default_context()
+
+
+def get_max_netid(lp_rpcport=7783):
+    """Highest netid whose ports still fit below 65535."""
+    return (65535 - 40 - lp_rpcport) // 4
+
+
+@lru_cache(maxsize=None)
+def ports_for(netid, lp_rpcport=7783):
+    """Return the (wss_port, tcp_port) pair of a netid, or None if it is out of range."""
+    if not (0 <= netid <= get_max_netid(lp_rpcport)):
+        return None
     
     if netid == 0:
         other_ports = lp_rpcport
     else:
         other_ports = ((netid // 10) * 40) + lp_rpcport + (netid % 10)
     
-    return other_ports + 30
+    return other_ports + 30, other_ports + 20
+
+
+def wss_port(netid, lp_rpcport=7783):
+    """Quick function to get WSS port from netid."""
+    """lp_rpcport is hardcoded to 7783 in kdf for calculating wss port"""
+    ports = ports_for(netid, lp_rpcport)
+    if ports is None:
+        raise ValueError(f"NetID must be between 0 and {get_max_netid(lp_rpcport)}")
+    return ports[0]
 
 
 def tcp_port(netid, lp_rpcport=7783):
     """Quick function to get TCP port from netid."""
     """lp_rpcport is hardcoded to 7783 in kdf for calculating tcp port"""
-    max_netid = (65535 - 40 - lp_rpcport) // 4
-    
-    if not (0 <= netid <= max_netid):
-        raise ValueError(f"NetID must be between 0 and {max_netid}")
-    
-    if netid == 0:
-        other_ports = lp_rpcport
-    else:
-        other_ports = ((netid // 10) * 40) + lp_rpcport + (netid % 10)
-    
-    return other_ports + 20
+    ports = ports_for(netid, lp_rpcport)
+    if ports is None:
+        raise ValueError(f"NetID must be between 0 and {get_max_netid(lp_rpcport)}")
+    return ports[1]
+
+
+# Fields of a seed node used by the summary and connectivity checks, read once per node
+SeedNode = namedtuple("SeedNode", "name host netid wss type contact_count")
+
+
+def project_seed_nodes(seed_nodes):
+    """Read the fields used after schema validation out of each seed node dict."""
+    return [
+        SeedNode(
+            node.get('name', 'unknown'),
+            node.get('host'),
+            node.get('netid', 8762),
+            node.get('wss', False),
+            node.get('type', 'unknown'),
+            len(node.get('contact', [])),
+        )
+        for node in seed_nodes
+    ]
 
 
 def get_project_root():
@@ -71,6 +121,9 @@ def get_project_root():
 def load_json_file(file_path):
     """Load and parse a JSON file."""
     try:
+        if orjson is not None:
+            with open(file_path, 'rb') as f:
+                return orjson.loads(f.read())
         with open(file_path, 'r', encoding='utf-8') as f:
             return json.load(f)
     except FileNotFoundError:
@@ -84,32 +137,31 @@ def load_json_file(file_path):
         return None
 
 
+@lru_cache(maxsize=None)
+def get_schema_validator(schema_path, mtime):
+    """Load and check a schema file once per path and mtime, returning its validator."""
+    schema = load_json_file(schema_path)
+    if schema is None:
+        return None
+    
+    jsonschema.Draft202012Validator.check_schema(schema)
+    return jsonschema.Draft202012Validator(schema)
+
+
 def check_duplicates(seed_nodes):
     """Check for duplicate names and hosts in seed nodes."""
     errors = []
     
     # Check for duplicate names
-    names = [node.get('name') for node in seed_nodes if node.get('name')]
-    seen_names = set()
-    duplicate_names = set()
-    
-    for name in names:
-        if name in seen_names:
-            duplicate_names.add(name)
-        seen_names.add(name)
+    name_counts = Counter(node.get('name') for node in seed_nodes if node.get('name'))
+    duplicate_names = [name for name, count in name_counts.items() if count > 1]
     
     if duplicate_names:
         errors.append(f"Duplicate seed node names found: {', '.join(sorted(duplicate_names))}")
     
     # Check for duplicate hosts
-    hosts = [node.get('host') for node in seed_nodes if node.get('host')]
-    seen_hosts = set()
-    duplicate_hosts = set()
-    
-    for host in hosts:
-        if host in seen_hosts:
-            duplicate_hosts.add(host)
-        seen_hosts.add(host)
+    host_counts = Counter(node.get('host') for node in seed_nodes if node.get('host'))
+    duplicate_hosts = [host for host, count in host_counts.items() if count > 1]
     
     if duplicate_hosts:
         errors.append(f"Duplicate seed node hosts found: {', '.join(sorted(duplicate_hosts))}")
@@ -117,90 +169,163 @@ def check_duplicates(seed_nodes):
     return errors
 
 
-def check_ssl_certificate(host, port, timeout=15):
-    """Check SSL certificate to ensure it's not self-signed and return issuer info."""
+if sys.version_info >= (3, 11):
+    async def with_timeout(aw, timeout):
+        """Await aw, raising asyncio.TimeoutError after timeout seconds."""
+        # asyncio.timeout cancels in place, without the extra task wait_for wraps aw in
+        async with asyncio.timeout(timeout):
+            return await aw
+else:
+    with_timeout = asyncio.wait_for
+
+
+async def resolve_host(host):
+    """
+    Resolve host once per run, so a node's WSS and TCP probes share one lookup.
+    Returns every resolved address, IPv4 first.
+    """
+    if host not in dns_cache:
+        loop = asyncio.get_running_loop()
+        dns_cache[host] = asyncio.ensure_future(loop.getaddrinfo(host, None, type=socket.SOCK_STREAM))
+    # Shield the shared lookup so a timed out probe doesn't cancel it for others
+    addresses = await asyncio.shield(dns_cache[host])
+    # Prefer IPv4 to avoid dual-stack hosts with unreachable IPv6 routes
+    return sorted(
+        dict.fromkeys((family, sockaddr[0]) for family, _, _, _, sockaddr in addresses),
+        key=lambda address: address[0] != socket.AF_INET,
+    )
+
+
+async def open_tcp_socket(addresses, port):
+    """
+    Open a plain TCP connection to the first reachable resolved address and return its socket.
+    Each address is tried in turn, as a plain connect to the host would, and the last
+    error is raised if none of them accept the connection.
+    """
+    loop = asyncio.get_running_loop()
+    last_error = None
+    for family, address in addresses:
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        try:
+            await loop.sock_connect(sock, (address, port))
+        except OSError as e:
+            sock.close()
+            last_error = e
+            continue
+        except BaseException:
+            sock.close()
+            raise
+        return sock
+    raise last_error or OSError(f"No addresses to connect to on port {port}")
+
+
+def check_ssl_certificate(cert):
+    """Check a peer's SSL certificate to ensure it's not self-signed and return issuer info."""
     try:
-        # Create SSL context with default verification
-        context = ssl.create_default_context()
+        # Check if certificate is self-signed
+        # A certificate is self-signed if issuer equals subject, compared as the raw
+        # name tuples without building a dict of either
+        is_self_signed = cert['issuer'] == cert['subject']
+        
+        # Extract issuer information, which both outcomes report
+        issuer = dict(x[0] for x in cert['issuer'])
+        issuer_cn = issuer.get('commonName', 'Unknown')
+        issuer_o = issuer.get('organizationName', '')
+        issuer_ou = issuer.get('organizationalUnitName', '')
+        
+        # Build issuer display string
+        issuer_parts = []
+        if issuer_cn:
+            issuer_parts.append(f"CN={issuer_cn}")
+        if issuer_o:
+            issuer_parts.append(f"O={issuer_o}")
+        if issuer_ou:
+            issuer_parts.append(f"OU={issuer_ou}")
+        
+        issuer_display = ", ".join(issuer_parts) if issuer_parts else "Unknown issuer"
+        
+        if is_self_signed:
+            return False, f"Certificate is self-signed (issuer: {issuer_display})"
+        
+        return True, f"Certificate is properly signed by {issuer_display}"
         
-        # Connect and get certificate information
-        with socket.create_connection((host, port), timeout=timeout) as sock:
-            with context.wrap_socket(sock, server_hostname=host) as ssock:
-                cert = ssock.getpeercert()
-                
-                # Check if certificate is self-signed
-                # A certificate is self-signed if issuer equals subject
-                issuer = dict(x[0] for x in cert['issuer'])
-                subject = dict(x[0] for x in cert['subject'])
-                
-                # Extract issuer information
-                issuer_cn = issuer.get('commonName', 'Unknown')
-                issuer_o = issuer.get('organizationName', '')
-                issuer_ou = issuer.get('organizationalUnitName', '')
-                
-                # Build issuer display string
-                issuer_parts = []
-                if issuer_cn:
-                    issuer_parts.append(f"CN={issuer_cn}")
-                if issuer_o:
-                    issuer_parts.append(f"O={issuer_o}")
-                if issuer_ou:
-                    issuer_parts.append(f"OU={issuer_ou}")
-                
-                issuer_display = ", ".join(issuer_parts) if issuer_parts else "Unknown issuer"
-                
-                is_self_signed = issuer == subject
-                
-                if is_self_signed:
-                    return False, f"Certificate is self-signed (issuer: {issuer_display})"
-                
-                return True, f"Certificate is properly signed by {issuer_display}"
-                
-    except ssl.SSLError as e:
-        return False, f"SSL error: {e}"
-    except socket.timeout:
-        return False, f"SSL check timeout after {timeout}s"
     except Exception as e:
         return False, f"Certificate check error: {e}"
 
 
-async def test_wss_connection(host, port, timeout=15):
-    """Test WSS connection to a seed node and check SSL certificate."""
+async def test_wss_connection(host, port, timeout=15, deep=False):
+    """
+    Test WSS connection to a seed node and check SSL certificate.
+    With deep, a ping round-trip over the open connection is also required.
+    """
     wss_url = f"wss://{host}:{port}"
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
-        # First check SSL certificate
-        loop = asyncio.get_event_loop()
-        cert_valid, cert_message = await loop.run_in_executor(
-            None, check_ssl_certificate, host, port, timeout
-        )
+        addresses = await with_timeout(resolve_host(host), timeout=timeout)
+        
+        # A plain TCP connect first lets unreachable nodes fail fast, before the
+        # TLS handshake; the WebSocket connection is then made over that socket
+        try:
+            sock = await with_timeout(open_tcp_socket(addresses, port), timeout=min(timeout, WSS_TCP_GATE_TIMEOUT))
+        except asyncio.TimeoutError:
+            elapsed_time = time.perf_counter() - start_time
+            return False, f"WSS port unreachable: connection timeout after {min(timeout, WSS_TCP_GATE_TIMEOUT)}s", elapsed_time
+        except ConnectionRefusedError:
+            elapsed_time = time.perf_counter() - start_time
+            return False, "WSS port unreachable: connection refused", elapsed_time
+        
+        # Connect with timeout. The certificate is checked on
+        # this same TLS session rather than a separate handshake.
+        # A short close_timeout stops close() waiting on slow peers to answer the
+        # closing handshake; the connection is simply dropped instead. Keepalive pings
+        # are disabled as the probe sends its own ping and closes straight after
+        try:
+            websocket = await with_timeout(
+                websockets.connect(
+                    wss_url, sock=sock, ssl=ssl_context, open_timeout=None, ping_interval=None, close_timeout=0.5
+                ),
+                timeout=timeout,
+            )
+        except ssl.SSLCertVerificationError as e:
+            sock.close()
+            elapsed_time = time.perf_counter() - start_time
+            return False, f"SSL certificate issue: SSL error: {e}", elapsed_time
+        except BaseException:
+            sock.close()
+            raise
         
+        cert_valid, cert_message = check_ssl_certificate(websocket.transport.get_extra_info('peercert'))
         if not cert_valid:
-            elapsed_time = time.time() - start_time
+            await websocket.close()
+            elapsed_time = time.perf_counter() - start_time
             return False, f"SSL certificate issue: {cert_message}", elapsed_time
         
-        # Connect with timeout using asyncio.wait_for
-        websocket = await asyncio.wait_for(websockets.connect(wss_url), timeout=timeout)
         try:
-            # Try to send a simple ping to verify the connection works
-            await asyncio.wait_for(websocket.ping(), timeout=2)
-            elapsed_time = time.time() - start_time
+            # The completed handshake already shows the node is reachable; a ping
+            # is only sent to confirm liveness when asked for
+            if deep:
+                await with_timeout(websocket.ping(), timeout=2)
+            elapsed_time = time.perf_counter() - start_time
             return True, f"Connected successfully, {cert_message}", elapsed_time
         finally:
             await websocket.close()
     except asyncio.TimeoutError:
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
         return False, f"Connection timeout after {timeout}s", elapsed_time
     except ssl.SSLError as e:
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
         return False, f"SSL error: {e}", elapsed_time
+    except socket.gaierror as e:
+        elapsed_time = time.perf_counter() - start_time
+        return False, f"DNS resolution failed: {e}", elapsed_time
     except OSError as e:
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
         return False, f"Network error: {e}", elapsed_time
     except Exception as e:
         # Handle various websockets exceptions that may vary by version
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
         error_msg = str(e)
         if "invalid uri" in error_msg.lower():
             return False, "Invalid WSS URI", elapsed_time
@@ -214,73 +339,96 @@ async def test_wss_connection(host, port, timeout=15):
 
 async def test_tcp_connection(host, port, timeout=15):
     """Test TCP connection to a seed node."""
-    start_time = time.time()
-    
-    def _test_connection():
-        try:
-            # Create socket and connect with timeout
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(timeout)
-            result = sock.connect_ex((host, port))
-            sock.close()
-            return result == 0, None
-        except socket.gaierror as e:
-            return False, f"DNS resolution failed: {e}"
-        except Exception as e:
-            return False, f"Socket error: {e}"
+    start_time = time.perf_counter()
     
     try:
-        # Run the blocking socket operation in a thread pool
-        loop = asyncio.get_event_loop()
-        success, error_msg = await loop.run_in_executor(None, _test_connection)
-        elapsed_time = time.time() - start_time
-        
-        if success:
-            return True, "Connected successfully", elapsed_time
-        elif error_msg:
-            return False, error_msg, elapsed_time
-        else:
-            return False, "Connection refused", elapsed_time
-            
+        # Connect on the event loop itself rather than a blocking socket in a thread.
+        # The shared resolved addresses are tried in turn; open_connection would
+        # either resolve the host again or only try a single address
+        addresses = await with_timeout(resolve_host(host), timeout=timeout)
+        sock = await with_timeout(open_tcp_socket(addresses, port), timeout=timeout)
+        sock.close()
+        elapsed_time = time.perf_counter() - start_time
+        return True, "Connected successfully", elapsed_time
+    except asyncio.TimeoutError:
+        elapsed_time = time.perf_counter() - start_time
+        return False, f"Connection timeout after {timeout}s", elapsed_time
+    except socket.gaierror as e:
+        elapsed_time = time.perf_counter() - start_time
+        return False, f"DNS resolution failed: {e}", elapsed_time
+    except ConnectionRefusedError:
+        elapsed_time = time.perf_counter() - start_time
+        return False, "Connection refused", elapsed_time
+    except OSError as e:
+        elapsed_time = time.perf_counter() - start_time
+        return False, f"Socket error: {e}", elapsed_time
     except Exception as e:
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
         return False, f"Unexpected error: {e}", elapsed_time
 
 
-async def check_wss_connectivity(seed_nodes):
-    """Check WSS connectivity and SSL certificate validation for seed nodes with WSS support enabled."""
-    print("🔍 Checking WSS connectivity and SSL certificates for seed nodes with WSS support...")
+def preflight(nodes):
+    """
+    Work out the WSS and TCP ports of every node before any probing.
+    Returns a list of (node, wss_port, tcp_port) and a list of (node, error)
+    for nodes with an invalid netid.
+    """
+    probe_nodes = []
+    invalid_nodes = []
+    for node in nodes:
+        ports = ports_for(node.netid)
+        if ports is None:
+            invalid_nodes.append((node, f"NetID must be between 0 and {get_max_netid()}"))
+        else:
+            probe_nodes.append((node, *ports))
+    return probe_nodes, invalid_nodes
+
+
+async def probe_connectivity(probe_nodes, deep=False):
+    """
+    Probe WSS connectivity of WSS-enabled nodes and TCP connectivity of all nodes
+    in one concurrent pass, so both sets of handshakes overlap.
+    Returns (wss_nodes, wss_results, tcp_nodes, tcp_results), each node list
+    holding (node, port) pairs in node order.
+    """
+    wss_nodes = [(node, port) for node, port, _ in probe_nodes if node.wss == True]
+    tcp_nodes = [(node, port) for node, _, port in probe_nodes]  # Check all nodes for TCP connectivity
+    
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_PROBES)
     
-    wss_nodes = [node for node in seed_nodes if node.get('wss') == True]
+    async def _test_node(probe):
+        async with semaphore:
+            return await probe
+    
+    results = await asyncio.gather(
+        *(_test_node(test_wss_connection(node.host, port, deep=deep)) for node, port in wss_nodes),
+        *(_test_node(test_tcp_connection(node.host, port)) for node, port in tcp_nodes),
+    )
+    return wss_nodes, results[:len(wss_nodes)], tcp_nodes, results[len(wss_nodes):]
+
+
+def check_wss_connectivity(wss_nodes, results):
+    """Report WSS connectivity and SSL certificate validation for seed nodes with WSS support enabled."""
+    print("🔍 Checking WSS connectivity and SSL certificates for seed nodes with WSS support...")
     
     if not wss_nodes:
         print("ℹ️  No WSS-enabled seed nodes found")
         return True
     
-    connectivity_results = []
-    for node in wss_nodes:
-        host = node.get('host')
-        name = node.get('name', 'unknown')
-        netid = node.get('netid', 8762)
-        
-        try:
-            calculated_wss_port = wss_port(netid)
-            print(f"  Testing {name} ({host}) on WSS port {calculated_wss_port} (netid: {netid})...")
-            print(f"    - Checking SSL certificate validity...")
-            success, message, elapsed_time = await test_wss_connection(host, calculated_wss_port)
-            connectivity_results.append((name, host, success, message))
-        except ValueError as e:
-            print(f"  ✗ Invalid netid {netid} for {name}: {e}")
-            connectivity_results.append((name, host, False, f"Invalid netid: {e}"))
-            elapsed_time = 0
-        
+    # Build the per-node report and write it out in one go
+    lines = []
+    for (node, port), (success, message, elapsed_time) in zip(wss_nodes, results):
+        lines.append(f"  Testing {node.name} ({node.host}) on WSS port {port} (netid: {node.netid})...")
+        lines.append(f"    - Checking SSL certificate validity...")
         if success:
-            print(f"    ✓ WSS connection successful ({elapsed_time:.2f}s)")
-            print(f"    ✓ {message}")
+            lines.append(f"    ✓ WSS connection successful ({elapsed_time:.2f}s)")
+            lines.append(f"    ✓ {message}")
         else:
-            print(f"    ✗ WSS connection failed: {message} ({elapsed_time:.2f}s)")
+            lines.append(f"    ✗ WSS connection failed: {message} ({elapsed_time:.2f}s)")
     
-    successful_connections = sum(1 for _, _, success, _ in connectivity_results if success)
+    sys.stdout.write("\n".join(lines) + "\n")
+    
+    successful_connections = sum(1 for success, _, _ in results if success)
     total_wss_nodes = len(wss_nodes)
     
     print(f"📊 WSS Connectivity Summary: {successful_connections}/{total_wss_nodes} WSS-enabled nodes reachable")
@@ -296,38 +444,26 @@ async def check_wss_connectivity(seed_nodes):
         return True
 
 
-async def check_tcp_connectivity(seed_nodes):
-    """Check TCP connectivity for all seed nodes."""
+def check_tcp_connectivity(tcp_nodes, results):
+    """Report TCP connectivity for all seed nodes."""
     print("🔍 Checking TCP connectivity for all seed nodes...")
     
-    tcp_nodes = seed_nodes  # Check all nodes for TCP connectivity
-    
     if not tcp_nodes:
         print("ℹ️  No seed nodes found")
         return True
     
-    connectivity_results = []
-    for node in tcp_nodes:
-        host = node.get('host')
-        name = node.get('name', 'unknown')
-        netid = node.get('netid', 8762)
-        
-        try:
-            calculated_tcp_port = tcp_port(netid)
-            print(f"  Testing {name} ({host}) on TCP port {calculated_tcp_port} (netid: {netid})...")
-            success, message, elapsed_time = await test_tcp_connection(host, calculated_tcp_port)
-            connectivity_results.append((name, host, success, message))
-        except ValueError as e:
-            print(f"  ✗ Invalid netid {netid} for {name}: {e}")
-            connectivity_results.append((name, host, False, f"Invalid netid: {e}"))
-            elapsed_time = 0
-        
+    # Build the per-node report and write it out in one go
+    lines = []
+    for (node, port), (success, message, elapsed_time) in zip(tcp_nodes, results):
+        lines.append(f"  Testing {node.name} ({node.host}) on TCP port {port} (netid: {node.netid})...")
         if success:
-            print(f"    ✓ TCP connection successful ({elapsed_time:.2f}s)")
+            lines.append(f"    ✓ TCP connection successful ({elapsed_time:.2f}s)")
         else:
-            print(f"    ✗ TCP connection failed: {message} ({elapsed_time:.2f}s)")
+            lines.append(f"    ✗ TCP connection failed: {message} ({elapsed_time:.2f}s)")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
     
-    successful_connections = sum(1 for _, _, success, _ in connectivity_results if success)
+    successful_connections = sum(1 for success, _, _ in results if success)
     total_tcp_nodes = len(tcp_nodes)
     
     print(f"📊 TCP Connectivity Summary: {successful_connections}/{total_tcp_nodes} nodes reachable via TCP")
@@ -343,13 +479,23 @@ async def check_tcp_connectivity(seed_nodes):
         return True
 
 
-async def validate_seed_nodes(seed_nodes_path=None, schema_path=None):
+def print_validation_error(e):
+    """Print a schema validation error with its location and offending value."""
+    print(f"✗ Validation failed: {e.message}")
+    if e.absolute_path:
+        print(f"  Path: {' -> '.join(str(p) for p in e.absolute_path)}")
+    if e.instance:
+        print(f"  Invalid value: {e.instance}")
+
+
+async def validate_seed_nodes(seed_nodes_path=None, schema_path=None, deep=False):
     """
     Validate seed-nodes.json against its schema and check connectivity.
     
     Args:
         seed_nodes_path: Path to seed-nodes.json (default: project_root/seed-nodes.json)
         schema_path: Path to schema file (default: utils/seed_nodes_schema.json)
+        deep: Also ping each WSS node after connecting to confirm liveness
     
     Returns:
         bool: True if validation passes, False otherwise
@@ -366,10 +512,19 @@ async def validate_seed_nodes(seed_nodes_path=None, schema_path=None):
     print(f"Schema: {schema_path}")
     print("-" * 50)
     
-    # Load schema
-    schema = load_json_file(schema_path)
-    if schema is None:
+    # Load and check the schema; the compiled validator is reused while the file is unchanged
+    try:
+        schema_mtime = os.path.getmtime(schema_path)
+    except OSError:
+        schema_mtime = None
+    try:
+        validator = get_schema_validator(schema_path, schema_mtime)
+    except SchemaError as e:
+        print(f"✗ Schema validation error: {e}")
         return False
+    if validator is None:
+        return False
+    print("✓ Schema is valid")
     
     # Load seed nodes data
     seed_nodes = load_json_file(seed_nodes_path)
@@ -377,12 +532,13 @@ async def validate_seed_nodes(seed_nodes_path=None, schema_path=None):
         return False
     
     try:
-        # Validate the schema itself first
-        jsonschema.Draft202012Validator.check_schema(schema)
-        print("✓ Schema is valid")
-        
-        # Validate the seed nodes data against the schema
-        validate(instance=seed_nodes, schema=schema)
+        # Validate the seed nodes data against the schema, reporting every error
+        # rather than only the first
+        errors = sorted(validator.iter_errors(seed_nodes), key=lambda e: [str(p) for p in e.absolute_path])
+        if errors:
+            for error in errors:
+                print_validation_error(error)
+            return False
         print("✓ Seed nodes file is valid!")
         print(f"✓ Found {len(seed_nodes)} seed nodes")
         
@@ -393,14 +549,11 @@ async def validate_seed_nodes(seed_nodes_path=None, schema_path=None):
                 print(f"✗ {error}")
             return False
         
+        nodes = project_seed_nodes(seed_nodes)
+        
         # Print summary of nodes
-        for i, node in enumerate(seed_nodes, 1):
-            host = node.get('host', 'unknown')
-            name = node.get('name', f'node-{i}')
-            node_type = node.get('type', 'unknown')
-            wss_support = node.get('wss', False)
-            netid = node.get('netid', 'unknown') # 14428 is the max netid if rpcport is 7783 lookup max_netid in kdf repo 
-            contact_count = len(node.get('contact', []))
+        for i, (name, host, netid, wss_support, node_type, contact_count) in enumerate(nodes, 1):
+            # netid: 14428 is the max netid if rpcport is 7783 lookup max_netid in kdf repo
             
             # Build protocol indicators
             protocols = []
@@ -411,23 +564,26 @@ async def validate_seed_nodes(seed_nodes_path=None, schema_path=None):
             
             print(f"  {i}. {name} ({host}) - type: {node_type} - {protocol_indicator} - netid: {netid} - {contact_count} contact(s)")
         
-        # Check WSS connectivity for WSS-enabled nodes
-        wss_connectivity_result = await check_wss_connectivity(seed_nodes)
+        # Work out every node's ports up front and stop before probing on invalid netids
+        probe_nodes, invalid_nodes = preflight(nodes)
+        if invalid_nodes:
+            for node, error in invalid_nodes:
+                print(f"✗ Invalid netid {node.netid} for {node.name}: {error}")
+            return False
+        
+        # Probe WSS-enabled nodes over WSS and all nodes over TCP together
+        wss_nodes, wss_results, tcp_nodes, tcp_results = await probe_connectivity(probe_nodes, deep=deep)
         
-        # Check TCP connectivity for TCP-enabled nodes
-        tcp_connectivity_result = await check_tcp_connectivity(seed_nodes)
+        # Report WSS connectivity for WSS-enabled nodes
+        wss_connectivity_result = check_wss_connectivity(wss_nodes, wss_results)
+        
+        # Report TCP connectivity for TCP-enabled nodes
+        tcp_connectivity_result = check_tcp_connectivity(tcp_nodes, tcp_results)
         
         return wss_connectivity_result and tcp_connectivity_result
         
-    except SchemaError as e:
-        print(f"✗ Schema validation error: {e}")
-        return False
     except ValidationError as e:
-        print(f"✗ Validation failed: {e.message}")
-        if e.absolute_path:
-            print(f"  Path: {' -> '.join(str(p) for p in e.absolute_path)}")
-        if e.instance:
-            print(f"  Invalid value: {e.instance}")
+        print_validation_error(e)
         return False
     except Exception as e:
         print(f"✗ Unexpected error: {e}")
@@ -440,38 +596,21 @@ async def main():
     print("=" * 50)
     
     # Parse command line arguments
-    seed_nodes_path = None
-    schema_path = None
-    
-    # Simple argument parsing
-    args = sys.argv[1:]
-    i = 0
-    while i < len(args):
-        arg = args[i]
-        if arg in ['--help', '-h']:
-            print("Usage: validate_seed_nodes.py [seed-nodes.json] [schema.json]")
-            print("  --help, -h          Show this help message")
-            print("")
-            print("This script validates seed nodes JSON schema and tests connectivity")
-            print("for all seed nodes. TCP for all and additionally WSS for seed nodes with 'wss': true.")
-            print("WSS connections also validate SSL certificates to ensure they are not self-signed.")
-            sys.exit(0)
-        elif arg.startswith('--'):
-            print(f"Unknown option: {arg}")
-            print("Use --help for usage information")
-            sys.exit(1)
-        elif seed_nodes_path is None:
-            seed_nodes_path = Path(arg)
-        elif schema_path is None:
-            schema_path = Path(arg)
-        else:
-            print(f"Too many arguments: {arg}")
-            print("Use --help for usage information")
-            sys.exit(1)
-        i += 1
+    parser = argparse.ArgumentParser(
+        description="Validates seed nodes JSON schema and tests connectivity for all seed nodes. "
+        "TCP for all and additionally WSS for seed nodes with 'wss': true. "
+        "WSS connections also validate SSL certificates to ensure they are not self-signed."
+    )
+    parser.add_argument('seed_nodes_path', nargs='?', type=Path, metavar='seed-nodes.json',
+                        help='Seed nodes file (default: seed-nodes.json in the project root)')
+    parser.add_argument('schema_path', nargs='?', type=Path, metavar='schema.json',
+                        help='Schema file (default: utils/seed_nodes_schema.json)')
+    parser.add_argument('--deep', action='store_true',
+                        help='Ping each WSS node after connecting to confirm liveness')
+    args = parser.parse_args()
     
     # Run validation
-    is_valid = await validate_seed_nodes(seed_nodes_path, schema_path)
+    is_valid = await validate_seed_nodes(args.seed_nodes_path, args.schema_path, deep=args.deep)
     
     print("-" * 50)
     if is_valid:
@@ -483,4 +622,12 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    # The status glyphs are UTF-8; write them as such even where the console default
+    # encoding can't represent them
+    sys.stdout.reconfigure(encoding='utf-8')
+    
+    # uvloop is optional, it only lowers event loop overhead for the probes
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main()) 
\ No newline at end of file